@@ -48,6 +48,11 @@ in cf.
       performed after every call to `esmpy`. By default logging is
       disabled.
 
+    REGRID_WEIGHTS_CACHE_SIZE: `int`
+      The maximum size, in bytes, of the in-memory cache of regridding
+      weights. By default it is 500 MiB. See
+      `cf.regrid_weights_cache_size`.
+
     LOG_LEVEL: `str`
       The minimal level of seriousness for which log messages are
       shown. See `cf.log_level`.
@@ -59,6 +64,7 @@ CONSTANTS = {
     "TEMPDIR": gettempdir(),
     "TOTAL_MEMORY": _TOTAL_MEMORY,
     "REGRID_LOGGING": False,
+    "REGRID_WEIGHTS_CACHE_SIZE": parse_bytes("500 MiB"),
     "RELAXED_IDENTITIES": False,
     "LOG_LEVEL": logging.getLevelName(logging.getLogger().level),
     "BOUNDS_COMBINATION_MODE": "AND",
@@ -176,16 +176,27 @@ def regrid(
 
     # ----------------------------------------------------------------
     # Reshape the array into a form suitable for the regridding dot
-    # product, i.e. a 2-d array whose right-hand dimension represents
-    # are the gathered regridding axes and whose left-hand dimension
-    # represent of all the other dimensions.
+    # product, i.e. a 2-d array whose left-hand dimension represents
+    # the gathered regridding axes and whose right-hand dimension
+    # represents all of the other dimensions.
+    #
+    # Performance note: The sparse matrix product iterates over the
+    #                   weights, applying each one to all of the
+    #                   non-regridding slices at once. This requires
+    #                   a C-contiguous 2-d array, so transpose the
+    #                   regridding axes to the front prior to
+    #                   reshaping, rather than reshaping and then
+    #                   transposing. This means that at most one copy
+    #                   of the data is made here, and none are made
+    #                   by the dot product.
     # ----------------------------------------------------------------
     n_src_axes = len(src_shape)
-    a = a.transpose(axis_order)
-    non_regrid_shape = a.shape[: a.ndim - n_src_axes]
+    n_non_regrid_axes = a.ndim - n_src_axes
+    order = list(axis_order)
+    a = a.transpose(order[n_non_regrid_axes:] + order[:n_non_regrid_axes])
+    non_regrid_shape = a.shape[n_src_axes:]
     dst_size, src_size = weights.shape
-    a = a.reshape(-1, src_size)
-    a = a.T
+    a = a.reshape(src_size, -1)
 
     # ----------------------------------------------------------------
     # Find the source grid mask
@@ -200,12 +211,12 @@ def regrid(
             src_mask = mask[:, 0]
             if not src_mask.any():
                 src_mask = None
+
+            del mask
         else:
             # Source mask varies across slices
             variable_mask = True
 
-        del mask
-
     if ref_src_mask is not None:
         # A reference source grid mask has already been incorporated
         # into the sparse weights matrix. Therefore, the mask for all
@@ -244,47 +255,46 @@ def regrid(
 
     if variable_mask:
         # Source data is masked and the source mask varies across
-        # slices => we have to regrid each slice separately, adjusting
-        # the sparse weights matrix for the mask of each slice.
+        # slices => we have to adjust the sparse weights matrix for
+        # the mask of each slice.
         #
-        # However, if the mask of a regrid slice is the same as the
-        # mask of its previous regrid slice then we can reuse the
-        # sparse weights matrix that already has the correct mask.
+        # However, many slices typically share the same mask (e.g. a
+        # land-sea mask that differs between vertical levels, but not
+        # between times), so group together the slices that have
+        # identical masks and regrid each group with a single sparse
+        # matrix multiplication, adjusting the weights matrix only
+        # once per group.
         n_slices = a.shape[1]
-        regridded_data = np.ma.empty(
-            (dst_size, n_slices), dtype=weights.dtype, order="F"
+        regridded_data = np.ma.empty((dst_size, n_slices), dtype=weights.dtype)
+        _, inverse, counts = np.unique(
+            np.packbits(mask, axis=0),
+            axis=1,
+            return_inverse=True,
+            return_counts=True,
         )
-        prev_weights, prev_src_mask, prev_dst_mask = None, None, None
-        for n in range(n_slices):
-            n = slice(n, n + 1)
-            a_n = a[:, n]
-            (
-                regridded_data[:, n],
-                prev_src_mask,
-                prev_dst_mask,
-                prev_weights,
-            ) = _regrid(
-                a_n,
-                np.ma.getmaskarray(a_n[:, 0]),
+
+        # Find the slices in each group with a single stable sort,
+        # rather than searching all of the slices once per group
+        order = np.argsort(inverse.reshape(-1), kind="stable")
+        for slices in np.split(order, np.cumsum(counts[:-1])):
+            regridded_data[:, slices] = _regrid(
+                a[:, slices],
+                mask[:, slices[0]],
                 dst_mask,
                 weights,
                 method,
-                prev_src_mask=prev_src_mask,
-                prev_dst_mask=prev_dst_mask,
-                prev_weights=prev_weights,
                 min_weight=min_weight,
             )
 
         a = regridded_data
-        del a_n, regridded_data, prev_weights, prev_src_mask, prev_dst_mask
+        del mask, regridded_data, order
     else:
         # Source data is either not masked or the source mask is same
         # for all slices => all slices can be regridded
         # simultaneously.
-        a, _, _, _ = _regrid(
+        a = _regrid(
             a, src_mask, dst_mask, weights, method, min_weight=min_weight
         )
-        del _
 
     # ----------------------------------------------------------------
     # Reshape the regridded data back to its original axis order
@@ -354,9 +364,6 @@ def _regrid(
     dst_mask,
     weights,
     method,
-    prev_src_mask=None,
-    prev_dst_mask=None,
-    prev_weights=None,
     min_weight=None,
 ):
     """Worker function for `regrid`.
@@ -375,8 +382,10 @@ def _regrid(
             The array to be regridded. Must have shape ``(I, n)``,
             where ``I`` is the number of source grid cells and ``n``
             is the number of regrid slices. Performance will be
-            optimised if *a* has Fortran order memory layout
-            (column-major order).
+            optimised if *a* has C order memory layout (row-major
+            order), as created by `regrid`, so that the sparse
+            matrix product with *weights* can read each row of *a*
+            contiguously, without making a copy.
 
         src_mask: `numpy.ndarray` or `None`
             The source grid mask to be applied to the weights
@@ -416,37 +425,10 @@ def _regrid(
         method: `str`
             The name of the regridding method.
 
-        prev_src_mask: `numpy.ndarray` or `None`
-            The source grid mask used by a previous call to `_regrid`.
-            See *prev_weights* for details.
-
-        prev_dst_mask: `numpy.ndarray` or `None`
-            The destination grid mask used by a previous call to
-            `_regrid`. If *prev_src_mask* equals *src_mask* then the
-            *prev_dst_mask* mask is used to calculate the regridded
-            data, bypassing any need to calculate a new destination
-            grid mask. Ignored if `prev_src_mask` is `None`.
-
-        prev_weights: `numpy.ndarray`, optional
-            The weights matrix used by a previous call to `_regrid`,
-            possibly modified to account for missing data. If
-            *prev_src_mask* equals *src_mask* then the *prev_weights*
-            weights matrix is used to calculate the regridded data,
-            bypassing any need to calculate a new weights matrix.
-            Ignored if `prev_src_mask` is `None`.
-
     :Returns:
 
-        4-`tuple`
-            * `numpy.ndarray`: The regridded data.
-            * `numpy.ndarray` or `None`: The source grid mask applied
-                                         to the returned weights
-                                         matrix, always identical to
-                                         the *src_mask* parameter.
-            * `numpy.ndarray` or `None`: The destination grid mask
-                                         applied to the regridded
-                                         data.
-            * `numpy.ndarray`: The weights matrix used to regrid *a*.
+        `numpy.ndarray`
+            The regridded data.
 
     """
     if src_mask is None or not src_mask.any():
@@ -454,14 +436,6 @@ def _regrid(
         # Source data is not masked
         # ------------------------------------------------------------
         pass
-    elif prev_src_mask is not None and (prev_src_mask == src_mask).all():
-        # ------------------------------------------------------------
-        # Source data is masked, but no need to modify the weights
-        # since we have been provided with an already-modified weights
-        # matrix.
-        # ------------------------------------------------------------
-        weights = prev_weights
-        dst_mask = prev_dst_mask
     else:
         # ------------------------------------------------------------
         # Source data is masked and we might need to adjust the
@@ -579,7 +553,7 @@ def _regrid(
         a = np.ma.array(a)
         a[dst_mask] = np.ma.masked
 
-    return a, src_mask, dst_mask, weights
+    return a
 
 
 def regrid_weights(operator, dst_dtype=None):
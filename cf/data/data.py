@@ -3860,6 +3860,7 @@ class Data(DataClassDeprecationsMixin, CFANetCDF, Container, cfdm.Data):
                 The regridded data.
 
         """
+        from ..regrid.regrid import nearest_methods
         from .dask_regrid import regrid, regrid_weights
 
         shape = self.shape
@@ -3876,6 +3877,11 @@ class Data(DataClassDeprecationsMixin, CFANetCDF, Container, cfdm.Data):
         # Rechunk so that each chunk contains data in the form
         # expected by the regrid operator, i.e. the regrid axes all
         # have chunksize -1.
+        #
+        # The chunks of the non-regrid axes are left unchanged. This
+        # preserves both the number and the positions of the chunks
+        # over which the regridding is carried out in parallel, with
+        # one task per non-regrid chunk.
         numblocks = dx.numblocks
         if not all(numblocks[i] == 1 for i in regrid_axes):
             chunks = [
@@ -3923,7 +3929,7 @@ class Data(DataClassDeprecationsMixin, CFANetCDF, Container, cfdm.Data):
             self._axes = axes
 
         # Set the output data type
-        if method in ("nearest_dtos", "nearest_stod"):
+        if method in nearest_methods:
             dst_dtype = dx.dtype
         else:
             dst_dtype = float
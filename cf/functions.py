@@ -170,6 +170,7 @@ def configuration(
     chunksize=None,
     log_level=None,
     regrid_logging=None,
+    regrid_weights_cache_size=None,
     relaxed_identities=None,
     bounds_combination_mode=None,
     of_fraction=None,
@@ -188,6 +189,7 @@ def configuration(
     * `chunksize`
     * `log_level`
     * `regrid_logging`
+    * `regrid_weights_cache_size`
     * `relaxed_identities`
     * `bounds_combination_mode`
 
@@ -208,7 +210,8 @@ def configuration(
 
     .. seealso:: `atol`, `rtol`, `tempdir`, `chunksize`,
                  `total_memory`, `log_level`, `regrid_logging`,
-                 `relaxed_identities`, `bounds_combination_mode`
+                 `regrid_weights_cache_size`, `relaxed_identities`,
+                 `bounds_combination_mode`
 
     :Parameters:
 
@@ -255,6 +258,13 @@ def configuration(
             disable it). The default is to not change the current
             behaviour.
 
+        regrid_weights_cache_size: `int` or `str` or `Constant`, optional
+            The new maximum size of the regridding weights cache, in
+            bytes. See `cf.regrid_weights_cache_size` for details. The
+            default is to not change the current value.
+
+            .. versionadded:: NEXTVERSION
+
         relaxed_identities: `bool` or `Constant`, optional
             The new value; if True, use "relaxed" mode when getting a
             construct identity. The default is to not change the
@@ -286,6 +296,7 @@ def configuration(
      'atol': 2.220446049250313e-16,
      'tempdir': '/tmp',
      'regrid_logging': False,
+     'regrid_weights_cache_size': 524288000,
      'relaxed_identities': False,
      'log_level': 'WARNING',
      'bounds_combination_mode': 'AND',
@@ -300,6 +311,7 @@ def configuration(
      'atol': 2.220446049250313e-16,
      'tempdir': '/tmp',
      'regrid_logging': False,
+     'regrid_weights_cache_size': 524288000,
      'relaxed_identities': False,
      'log_level': 'WARNING',
      'bounds_combination_mode': 'AND',
@@ -309,6 +321,7 @@ def configuration(
      'atol': 2.220446049250313e-16,
      'tempdir': '/usr/tmp',
      'regrid_logging': False,
+     'regrid_weights_cache_size': 524288000,
      'relaxed_identities': False,
      'log_level': 'INFO',
      'bounds_combination_mode': 'AND',
@@ -321,6 +334,7 @@ def configuration(
      'atol': 2.220446049250313e-16,
      'tempdir': '/usr/tmp',
      'regrid_logging': False,
+     'regrid_weights_cache_size': 524288000,
      'relaxed_identities': False,
      'log_level': 'INFO',
      'bounds_combination_mode': 'AND',
@@ -332,6 +346,7 @@ def configuration(
      'atol': 10.0,
      'tempdir': '/usr/tmp',
      'regrid_logging': False,
+     'regrid_weights_cache_size': 524288000,
      'relaxed_identities': False,
      'log_level': 'INFO',
      'bounds_combination_mode': 'AND',
@@ -341,6 +356,7 @@ def configuration(
      'atol': 2.220446049250313e-16,
      'tempdir': '/usr/tmp',
      'regrid_logging': False,
+     'regrid_weights_cache_size': 524288000,
      'relaxed_identities': False,
      'log_level': 'INFO',
      'bounds_combination_mode': 'AND',
@@ -373,6 +389,7 @@ def configuration(
         new_chunksize=chunksize,
         new_log_level=log_level,
         new_regrid_logging=regrid_logging,
+        new_regrid_weights_cache_size=regrid_weights_cache_size,
         new_relaxed_identities=relaxed_identities,
         bounds_combination_mode=bounds_combination_mode,
     )
@@ -422,6 +439,7 @@ def _configuration(_Configuration, **kwargs):
         "new_chunksize": chunksize,
         "new_log_level": log_level,
         "new_regrid_logging": regrid_logging,
+        "new_regrid_weights_cache_size": regrid_weights_cache_size,
         "new_relaxed_identities": relaxed_identities,
         "bounds_combination_mode": bounds_combination_mode,
     }
@@ -586,6 +604,88 @@ class regrid_logging(ConstantAccess):
         return bool(arg)
 
 
+class regrid_weights_cache_size(ConstantAccess):
+    """The maximum size of the regridding weights cache.
+
+    Regridding weights that are created by `cf.Field.regrids` and
+    `cf.Field.regridc` are cached in memory, so that repeated
+    regridding between the same source and destination grids does not
+    need to recalculate them. When the total size of the cached
+    weights exceeds the maximum size, the least recently used weights
+    are discarded. A size of zero disables the cache.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.regrid.clear_weights_cache`,
+                 `cf.regrid.weights_cache_info`
+
+    :Parameters:
+
+        arg: number or `str` or `Constant`, optional
+            The new maximum size of the cache in bytes. Any size
+            accepted by `dask.utils.parse_bytes` is accepted, for
+            instance ``0``, ``2**30``, ``'500 MiB'``, and ``'1GB'``
+            are all valid sizes. The default is to not change the
+            current value, which is initially 500 MiB.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> cf.regrid_weights_cache_size()
+    <CF Constant: 524288000>
+    >>> cf.regrid_weights_cache_size('1 GiB')
+    <CF Constant: 524288000>
+    >>> cf.regrid_weights_cache_size()
+    <CF Constant: 1073741824>
+    >>> with cf.regrid_weights_cache_size(0):
+    ...     print(cf.regrid_weights_cache_size())
+    ...
+    0
+    >>> cf.regrid_weights_cache_size()
+    <CF Constant: 1073741824>
+
+    """
+
+    _name = "REGRID_WEIGHTS_CACHE_SIZE"
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for insertion
+                into the `CONSTANTS` dictionary.
+
+        """
+        from .regrid.regrid import _evict_weights
+
+        arg = parse_bytes(arg)
+        if arg < 0:
+            raise ValueError(
+                "The regridding weights cache size must be non-negative. "
+                f"Got: {arg!r}"
+            )
+
+        # Discard any cached weights that no longer fit
+        _evict_weights(arg)
+        return arg
+
+
 class collapse_parallel_mode(ConstantAccess):
     """Which mode to use when collapse is run in parallel. There are
     three possible modes:
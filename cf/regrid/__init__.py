@@ -1,2 +1,2 @@
-from .regrid import regrid
+from .regrid import clear_weights_cache, regrid, weights_cache_info
 from .regridoperator import RegridOperator
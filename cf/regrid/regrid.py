@@ -1,33 +1,33 @@
 """Worker functions for regridding."""
 
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
+from hashlib import blake2b
 from typing import Any
 
 import dask.array as da
 import numpy as np
 from cfdm import is_log_level_debug
 
-from ..functions import DeprecationError, regrid_logging
+from ..functions import (
+    DeprecationError,
+    regrid_logging,
+    regrid_weights_cache_size,
+)
 from ..units import Units
 from .regridoperator import RegridOperator
 
-# ESMF renamed its Python module to `esmpy` at ESMF version 8.4.0. Allow
-# either for now for backwards compatibility.
-esmpy_imported = False
-try:
-    import esmpy
+# The `esmpy` module. This is not imported until it is first needed
+# (see `get_esmpy`), so that processes which never regrid don't pay
+# the cost of importing it.
+esmpy = None
+_esmpy_import_attempted = False
 
-    esmpy_imported = True
-except ImportError:
-    try:
-        # Take the new name to use in preference to the old one.
-        import ESMF as esmpy
-
-        esmpy_imported = True
-    except ImportError:
-        pass
+# The `esmpy` manager, created the first time that `esmpy_initialise`
+# is run and then kept for the lifetime of the process.
+_esmpy_manager = None
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +45,51 @@ esmpy_methods = {
     "patch": None,
 }
 
+# Mapping of the number of grid axes to the esmpy grid (centre,
+# corner) stagger locations. For details see
+#
+# 2-d:
+# https://earthsystemmodeling.org/docs/release/latest/ESMF_refdoc/node5.html#fig:gridstaggerloc2d
+#
+# 3-d:
+# https://earthsystemmodeling.org/docs/release/latest/ESMF_refdoc/node5.html#fig:gridstaggerloc3d
+#
+# The values get replaced with `esmpy.StaggerLoc` constants the
+# first time `esmpy_initialise` is run.
+esmpy_staggerlocs = {2: None, 3: None}
+
+# Regrid methods for which the source and destination grid masks
+# must be taken into account by `esmpy` when calculating the regrid
+# weights, rather than being applied retrospectively to weights that
+# have been calculated assuming no masks. See `cf.data.dask_regrid`.
+esmpy_mask_methods = ("patch", "conservative_2nd", "nearest_stod")
+
+# Conservative regrid methods
+conservative_methods = ("conservative", "conservative_1st", "conservative_2nd")
+
+# Nearest neighbour regrid methods
+nearest_methods = ("nearest_dtos", "nearest_stod")
+
+# Regrid methods that are not available for 1-d regridding
+multidimensional_methods = ("conservative_2nd", "patch")
+
+# Cache of regridding weights created by `esmpy`, keyed by
+# fingerprints of the source and destination grids (see
+# `weights_cache_key`). The least recently used entries are discarded
+# first when the cache is full (see `cf.regrid_weights_cache_size`).
+_weights_cache = OrderedDict()
+
+# The coordinates and bounds of the dummy axis that is added to 1-d
+# Cartesian grids, because esmpy doesn't like creating weights for
+# 1-d regridding. They are read-only so that they can be shared by
+# all grids without being copied.
+_dummy_axis_points = np.array([-1.0, 1.0])
+_dummy_axis_points.setflags(write=False)
+_dummy_axis_point = np.array([0.0])
+_dummy_axis_point.setflags(write=False)
+_dummy_axis_bounds = np.array([[-1.0, 1.0]])
+_dummy_axis_bounds.setflags(write=False)
+
 
 @dataclass()
 class Grid:
@@ -346,7 +391,14 @@ def regrid(
     # ----------------------------------------------------------------
     if isinstance(dst, RegridOperator):
         regrid_operator = dst
-        dst = regrid_operator.dst.copy()
+        dst = regrid_operator.dst
+        if not isinstance(dst, src._Domain):
+            # A destination field might get modified in-place by
+            # `get_grid` (which can insert size 1 data dimensions),
+            # so copy it. A destination domain is never modified, so
+            # there is no need to copy it.
+            dst = dst.copy()
+
         method = regrid_operator.method
         dst_cyclic = regrid_operator.dst_cyclic
         dst_axes = regrid_operator.dst_axes
@@ -501,12 +553,12 @@ def regrid(
 
     conform_coordinates(src_grid, dst_grid)
 
-    if method in ("conservative_2nd", "patch"):
+    if method in multidimensional_methods:
         if not (src_grid.dimensionality >= 2 and dst_grid.dimensionality >= 2):
             raise ValueError(
                 f"{method!r} regridding is not available for 1-d regridding"
             )
-    elif method in ("nearest_dtos", "nearest_stod"):
+    elif method in nearest_methods:
         if not has_coordinate_arrays(src_grid) and not has_coordinate_arrays(
             dst_grid
         ):
@@ -546,36 +598,30 @@ def regrid(
         # ------------------------------------------------------------
         # Create a new regrid operator
         # ------------------------------------------------------------
-        esmpy_manager = esmpy_initialise()  # noqa: F841
-
         # Create a mask for the destination grid
         dst_mask = None
         grid_dst_mask = None
         if use_dst_mask:
             dst_mask = get_mask(dst, dst_grid)
-            if (
-                method in ("patch", "conservative_2nd", "nearest_stod")
-                or return_esmpy_regrid_operator
-            ):
+            if method in esmpy_mask_methods or return_esmpy_regrid_operator:
                 # For these regridding methods, the destination mask
                 # must be taken into account during the esmpy
                 # calculation of the regrid weights, rather than the
                 # mask being applied retrospectively to weights that
                 # have been calculated assuming no destination grid
                 # mask. See `cf.data.dask_regrid`.
-                grid_dst_mask = np.array(dst_mask.transpose())
+                #
+                # Note: The esmpy grid mask only needs a transposed
+                #       view of the computed mask, so there is no need
+                #       to copy it.
+                grid_dst_mask = np.asarray(dst_mask).T
                 dst_mask = None
 
-        # Create the destination esmpy.Grid
-        dst_esmpy_grid = create_esmpy_grid(dst_grid, grid_dst_mask)
-        del grid_dst_mask
-
         # Create a mask for the source grid
         src_mask = None
         grid_src_mask = None
         if use_src_mask and (
-            method in ("patch", "conservative_2nd", "nearest_stod")
-            or return_esmpy_regrid_operator
+            method in esmpy_mask_methods or return_esmpy_regrid_operator
         ):
             # For patch recovery and second-order conservative
             # regridding, the source mask needs to be taken into
@@ -583,48 +629,93 @@ def regrid(
             # weights, rather than the mask being applied
             # retrospectively to weights that have been calculated
             # assuming no source grid mask. See `cf.data.dask_regrid`.
-            src_mask = get_mask(src, src_grid)
-            grid_src_mask = np.array(src_mask.transpose())
+            src_mask = np.asarray(get_mask(src, src_grid))
+            grid_src_mask = src_mask.T
             if not grid_src_mask.any():
                 # There are no masked source cells, so we can collapse
                 # the mask that gets stored in the regrid operator.
                 src_mask = np.array(False)
                 grid_src_mask = src_mask
 
-        # Create the source esmpy.Grid
-        src_esmpy_grid = create_esmpy_grid(src_grid, grid_src_mask)
-        del grid_src_mask
-
-        if is_log_level_debug(logger):
-            logger.debug(
-                f"Source ESMF Grid:\n{src_esmpy_grid}\n\nDestination ESMF Grid:\n{dst_esmpy_grid}\n"
-            )  # pragma: no cover
-
-        esmpy_regrid_operator = [] if return_esmpy_regrid_operator else None
-
-        # Create regrid weights
-        weights, row, col, start_index, from_file = create_esmpy_weights(
-            method,
-            src_esmpy_grid,
-            dst_esmpy_grid,
-            src_grid=src_grid,
-            dst_grid=dst_grid,
-            ignore_degenerate=ignore_degenerate,
-            quarter=src_grid.dummy_size_2_dimension,
-            esmpy_regrid_operator=esmpy_regrid_operator,
-            weights_file=weights_file,
-        )
+        # Look for previously created weights between the same source
+        # and destination grids. Weights that are read from or
+        # written to a file, and weights for which the esmpy.Regrid
+        # instance has been requested, are never cached.
+        #
+        # Performance note: Creating the cache key requires the grid
+        #                   coordinates to be computed and hashed, so
+        #                   it is skipped when the cache is disabled.
+        weights_key = None
+        if (
+            regrid_weights_cache_size().value
+            and weights_file is None
+            and not return_esmpy_regrid_operator
+        ):
+            weights_key = weights_cache_key(
+                method,
+                src_grid,
+                dst_grid,
+                grid_src_mask,
+                grid_dst_mask,
+                ignore_degenerate,
+            )
+
+        cached_weights = get_cached_weights(weights_key)
+        if cached_weights is not None:
+            weights, row, col, start_index = cached_weights
+            from_file = False
+        else:
+            esmpy_initialise()
+
+            esmpy_regrid_operator = (
+                [] if return_esmpy_regrid_operator else None
+            )
+
+            dst_esmpy_grid = None
+            src_esmpy_grid = None
+            try:
+                # Create the destination esmpy.Grid
+                dst_esmpy_grid = create_esmpy_grid(dst_grid, grid_dst_mask)
+
+                # Create the source esmpy.Grid
+                src_esmpy_grid = create_esmpy_grid(src_grid, grid_src_mask)
+
+                if is_log_level_debug(logger):
+                    logger.debug(
+                        f"Source ESMF Grid:\n{src_esmpy_grid}\n\nDestination ESMF Grid:\n{dst_esmpy_grid}\n"
+                    )  # pragma: no cover
+
+                # Create regrid weights
+                (
+                    weights,
+                    row,
+                    col,
+                    start_index,
+                    from_file,
+                ) = create_esmpy_weights(
+                    method,
+                    src_esmpy_grid,
+                    dst_esmpy_grid,
+                    src_grid=src_grid,
+                    dst_grid=dst_grid,
+                    ignore_degenerate=ignore_degenerate,
+                    quarter=src_grid.dummy_size_2_dimension,
+                    esmpy_regrid_operator=esmpy_regrid_operator,
+                    weights_file=weights_file,
+                )
+            except BaseException:
+                # Make sure that the esmpy grids don't leak when the
+                # weights couldn't be created
+                esmpy_destroy(dst_esmpy_grid, src_esmpy_grid)
+                raise
 
-        if return_esmpy_regrid_operator:
-            # Return the equivalent esmpy.Regrid operator
-            return esmpy_regrid_operator[-1]
+            if return_esmpy_regrid_operator:
+                # Return the equivalent esmpy.Regrid operator
+                return esmpy_regrid_operator[-1]
 
-        # Still here? Then we've finished with esmpy, so finalise the
-        # esmpy manager. This is done to free up any Persistent
-        # Execution Threads (PETs) created by the esmpy Virtual
-        # Machine:
-        # https://earthsystemmodeling.org/esmpy_doc/release/latest/html/api.html#resource-allocation
-        del esmpy_manager
+            cache_weights(weights_key, weights, row, col, start_index)
+
+        del grid_src_mask, grid_dst_mask
 
         if src_grid.dummy_size_2_dimension:
             # We have a dummy size_2 dimension, so remove its
@@ -661,6 +752,13 @@ def regrid(
             dst_z=dst_grid.z,
             ln_z=ln_z,
         )
+
+        if not from_file:
+            # Convert the weights to a sparse array now, so that the
+            # row and column indices can be discarded, and so that
+            # the conversion doesn't have to happen in every process
+            # that uses the regrid operator.
+            regrid_operator.tosparse()
     else:
         if weights_file is not None:
             raise ValueError(
@@ -871,35 +969,31 @@ def spherical_coords_to_domain(
     d = domain_class()
 
     # Set domain axes
-    axis_keys = []
-    for size in axis_sizes:
-        key = d.set_construct(d._DomainAxis(size), copy=False)
-        axis_keys.append(key)
-
-    coord_axes = []
-    if coords_1d:
-        # Set 1-d coordinates
-        coord_axes = []
-        for key, axis in zip(("lat", "lon"), axis_keys):
-            da_key = d.set_construct(coords[key], axes=axis, copy=False)
-            coord_axes.append(da_key)
-
-        if dst_axes and "X" in dst_axes and dst_axes["X"] == 0:
-            coord_axes = coord_axes[::-1]
-    else:
-        # Set 2-d coordinates
-        coord_axes = axis_keys
-        if dst_axes["X"] == 0:
-            coord_axes = coord_axes[::-1]
-
-        for coord in coords.values():
-            d.set_construct(coord, axes=coord_axes, copy=False)
+    axis_keys = [
+        d.set_construct(d._DomainAxis(size), copy=False) for size in axis_sizes
+    ]
+
+    # The Y and X domain axes, in the order of the dimensions of 2-d
+    # latitude and longitude coordinates, or of the first two
+    # dimensions of 3-d vertical coordinates.
+    coord_axes = tuple(axis_keys)
+    if dst_axes and dst_axes.get("X") == 0:
+        coord_axes = coord_axes[::-1]
+
+    # Set 1-d or 2-d latitude and longitude coordinates
+    for key, axis in zip(("lat", "lon"), axis_keys):
+        d.set_construct(
+            coords[key], axes=axis if coords_1d else coord_axes, copy=False
+        )
 
     if cyclic is not None:
         # Reset X axis cyclicity
         d.cyclic(axis_keys[1], iscyclic=cyclic, period=360)
 
-    dst_axes = {"Y": axis_keys[0], "X": axis_keys[1]}
+    # The domain axis identifiers of the regrid axes. Note that the
+    # *dst_axes* parameter is still needed for checking 3-d vertical
+    # coordinates, so it is not overwritten.
+    axes = {"Y": axis_keys[0], "X": axis_keys[1]}
 
     if dst_z is not None:
         # ------------------------------------------------------------
@@ -908,7 +1002,7 @@ def spherical_coords_to_domain(
         z_coord = coords["Z"]
         if z_coord.ndim == 1:
             z_axis = d.set_construct(d._DomainAxis(z_coord.size), copy=False)
-            d.set_construct(z_coord, axes=z_axis, copy=False)
+            z_key = d.set_construct(z_coord, axes=z_axis, copy=False)
         elif z_coord.ndim == 3:
             if dst_axes is None or "Z" not in dst_axes or dst_axes["Z"] != 2:
                 raise ValueError(
@@ -924,6 +1018,12 @@ def spherical_coords_to_domain(
             z_key = d.set_construct(
                 z_coord, axes=coord_axes + (z_axis,), copy=False
             )
+        else:
+            raise ValueError(
+                "When 'dst' is a sequence containing a vertical "
+                "coordinate construct, it must be either 1-d or 3-d. "
+                f"Got: {z_coord!r}"
+            )
 
         # Check that z_coord is indeed a vertical coordinate
         # construct, and replace 'dst_z' with its construct
@@ -935,9 +1035,9 @@ def spherical_coords_to_domain(
             )
 
         dst_z = key
-        dst_axes["Z"] = z_axis
+        axes["Z"] = z_axis
 
-    return d, dst_axes, dst_z
+    return d, axes, dst_z
 
 
 def Cartesian_coords_to_domain(dst, dst_z=None, domain_class=None):
@@ -1273,9 +1373,12 @@ def spherical_grid(
     # Convert 2-d coordinate arrays to esmpy axis order = [X, Y]
     if aux_coords_2d:
         for dim, coord_key in enumerate((lon_key, lat_key)):
-            coord_axes = data_axes[coord_key]
-            esmpy_order = [coord_axes.index(axis) for axis in (x_axis, y_axis)]
-            coords[dim] = coords[dim].transpose(esmpy_order)
+            axis_position = {
+                axis: i for i, axis in enumerate(data_axes[coord_key])
+            }
+            esmpy_order = [axis_position[axis] for axis in (x_axis, y_axis)]
+            if esmpy_order != [0, 1]:
+                coords[dim] = coords[dim].transpose(esmpy_order)
 
     # Set cyclicity of X axis
     if mesh_location or featureType:
@@ -1364,10 +1467,14 @@ def spherical_grid(
                 ][0]
 
                 # Re-order 3-d Z coordinates to ESMF order
+                axis_position = {axis: i for i, axis in enumerate(coord_axes)}
                 esmpy_order = [
-                    coord_axes.index(axis) for axis in (x_axis, y_axis, z_axis)
+                    axis_position[axis] for axis in (x_axis, y_axis, z_axis)
                 ]
-                z_coord = z_3d.transpose(esmpy_order)
+                if esmpy_order == [0, 1, 2]:
+                    z_coord = z_3d
+                else:
+                    z_coord = z_3d.transpose(esmpy_order)
 
         coords.append(z_coord)  # esmpy order
 
@@ -1394,8 +1501,8 @@ def spherical_grid(
 
         # The indices of the regridding axes, in the order expected by
         # `Data._regrid`.
-        data_axes = f.get_data_axes()
-        axis_indices = [data_axes.index(key) for key in axis_keys]
+        axis_position = {axis: i for i, axis in enumerate(f.get_data_axes())}
+        axis_indices = [axis_position[key] for key in axis_keys]
 
     is_mesh = bool(mesh_location)
     is_locstream = bool(featureType)
@@ -1559,8 +1666,8 @@ def Cartesian_grid(f, name=None, method=None, axes=None, z=None, ln_z=None):
 
         # The indices of the regridding axes, in the order expected by
         # `Data._regrid`.
-        data_axes = f.get_data_axes()
-        axis_indices = [data_axes.index(key) for key in axis_keys]
+        axis_position = {axis: i for i, axis in enumerate(f.get_data_axes())}
+        axis_indices = [axis_position[key] for key in axis_keys]
 
     cyclic = False
     coord_ids = axes[::-1]
@@ -1608,15 +1715,14 @@ def Cartesian_grid(f, name=None, method=None, axes=None, z=None, ln_z=None):
     if not (mesh_location or featureType) and len(coords) == 1:
         # Create a dummy axis because esmpy doesn't like creating
         # weights for 1-d regridding
-        data = np.array([-1.0, 1.0])
         if conservative_regridding(method):
             # For conservative regridding the extra dimension can be
             # size 1
-            coords.append(np.array([0.0]))
-            bounds.append(np.array([data]))
+            coords.append(_dummy_axis_point)
+            bounds.append(_dummy_axis_bounds)
         else:
             # For linear regridding the extra dimension must be size 2
-            coords.append(data)
+            coords.append(_dummy_axis_points)
             dummy_size_2_dimension = True
 
     n_regrid_axes = len(axis_keys)
@@ -1795,39 +1901,89 @@ def check_operator(src, src_grid, regrid_operator, check_coordinates=False):
     if not check_coordinates:
         return True
 
-    # Still here? Then check also the coordinates and bounds
-    for a, b in zip(regrid_operator.src_coords, src_grid.coords):
-        a = np.asanyarray(a)
-        b = np.asanyarray(b)
-        if not np.array_equal(a, b):
-            raise ValueError(
-                f"Can't regrid {src!r} with {regrid_operator!r}: "
-                "Source grid coordinates mismatch"
-            )
+    # Still here? Then check also the coordinates and bounds.
+    #
+    # Performance note: Identical objects (such as the dummy axis of
+    #                   1-d Cartesian grids) and objects with
+    #                   different shapes are dealt with without
+    #                   reading any values.
+    for x, y, name in (
+        (regrid_operator.src_coords, src_grid.coords, "coordinates"),
+        (regrid_operator.src_bounds, src_grid.bounds, "coordinate bounds"),
+    ):
+        for a, b in zip(x, y):
+            if a is b:
+                continue
+
+            if np.shape(a) == np.shape(b):
+                a = np.asanyarray(a)
+                b = np.asanyarray(b)
+                if np.array_equal(a, b):
+                    continue
 
-    for a, b in zip(regrid_operator.src_bounds, src_grid.bounds):
-        a = np.asanyarray(a)
-        b = np.asanyarray(b)
-        if not np.array_equal(a, b):
             raise ValueError(
                 f"Can't regrid {src!r} with {regrid_operator!r}: "
-                "Source grid coordinate bounds mismatch"
+                f"Source grid {name} mismatch"
             )
 
     return True
 
 
+def get_esmpy():
+    """Return the `esmpy` module, importing it if necessary.
+
+    The import is only attempted once, and the module is stored in
+    the global ``esmpy`` variable.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `esmpy_initialise`
+
+    :Returns:
+
+        module or `None`
+            The `esmpy` module, or `None` if it could not be
+            imported.
+
+    """
+    global esmpy, _esmpy_import_attempted
+
+    if esmpy is None and not _esmpy_import_attempted:
+        _esmpy_import_attempted = True
+
+        # ESMF renamed its Python module to `esmpy` at ESMF version
+        # 8.4.0. Allow either for now for backwards compatibility.
+        try:
+            import esmpy
+        except ImportError:
+            try:
+                # Take the new name to use in preference to the old
+                # one.
+                import ESMF as esmpy
+            except ImportError:
+                pass
+
+    return esmpy
+
+
 def esmpy_initialise():
     """Initialise the `esmpy` manager.
 
     The is a null operation if the manager has already been
     initialised.
 
+    The manager is kept for the lifetime of the process, rather than
+    being created and finalised for each regrid operation, because
+    the ESMF Virtual Machine can only be initialised once per
+    process. `esmpy` finalises it when the interpreter exits.
+
     Whether esmpy logging is enabled or not is determined by
-    `cf.regrid_logging`.
+    `cf.regrid_logging` at the time that the manager is first
+    created.
 
-    Also initialises the global 'esmpy_methods' dictionary, unless it
-    has already been initialised.
+    Also imports `esmpy` (see `get_esmpy`) and initialises the global
+    'esmpy_methods' and 'esmpy_staggerlocs' dictionaries, unless
+    these have already been done.
 
     :Returns:
 
@@ -1835,7 +1991,9 @@ def esmpy_initialise():
             The `esmpy` manager.
 
     """
-    if not esmpy_imported:
+    global _esmpy_manager
+
+    if get_esmpy() is None:
         raise RuntimeError(
             "Regridding will not work unless the esmpy library is installed"
         )
@@ -1862,7 +2020,22 @@ def esmpy_initialise():
         # interpolation, which could mislead or confuse for Cartesian
         # regridding in 1D or 3D.
 
-    return esmpy.Manager(debug=bool(regrid_logging()))
+    # Update the global 'esmpy_staggerlocs' dictionary
+    if esmpy_staggerlocs[2] is None:
+        esmpy_staggerlocs.update(
+            {
+                2: (esmpy.StaggerLoc.CENTER, esmpy.StaggerLoc.CORNER),
+                3: (
+                    esmpy.StaggerLoc.CENTER_VCENTER,
+                    esmpy.StaggerLoc.CORNER_VFACE,
+                ),
+            }
+        )
+
+    if _esmpy_manager is None:
+        _esmpy_manager = esmpy.Manager(debug=bool(regrid_logging()))
+
+    return _esmpy_manager
 
 
 def create_esmpy_grid(grid, mask=None):
@@ -1915,8 +2088,15 @@ def create_esmpy_grid(grid, mask=None):
         coord_sys = esmpy.CoordSys.CART
 
     # Parse coordinates for the esmpy.Grid, and get its shape.
+    #
+    # Performance note: The esmpy.Grid coordinates are stored as
+    #                   C-contiguous 64-bit floats, so we convert each
+    #                   coordinate array to this form once, here,
+    #                   rather than have a strided and/or type-casting
+    #                   copy occur when the values are assigned to the
+    #                   esmpy.Grid.
     n_axes = len(coords)
-    coords = [np.asanyarray(c) for c in coords]
+    coords = [np.ascontiguousarray(c, dtype="float64") for c in coords]
     shape = [None] * n_axes
     for dim, c in enumerate(coords[:]):
         ndim = c.ndim
@@ -1941,11 +2121,26 @@ def create_esmpy_grid(grid, mask=None):
         coords[dim] = c
 
     # Parse bounds for the esmpy.Grid
+    bounds_2d = []
     if bounds:
-        bounds = [np.asanyarray(b) for b in bounds]
+        # Performance note: As for the coordinates, the bounds are
+        #                   converted once to the 64-bit floats that
+        #                   esmpy stores, rather than on each
+        #                   assignment to the esmpy.Grid corners. Any
+        #                   mask is kept, so that the contiguity
+        #                   checks and latitude clipping below remain
+        #                   mask-aware.
+        bounds = [
+            np.asanyarray(b).astype("float64", copy=False) for b in bounds
+        ]
 
         if spherical:
-            bounds[lat] = np.clip(bounds[lat], -90, 90)
+            # Performance note: Only clip the latitude bounds when
+            #                   they are actually out of range, which
+            #                   avoids copying them in the usual case.
+            b = bounds[lat]
+            if b.size and (b.min() < -90 or b.max() > 90):
+                bounds[lat] = np.clip(b, -90, 90)
             if not contiguous_bounds(bounds[lat]):
                 raise ValueError(
                     f"The {grid.name} latitude coordinates must have "
@@ -1999,33 +2194,11 @@ def create_esmpy_grid(grid, mask=None):
                     [tmp.size if i == dim else 1 for i in range(n_axes)]
                 )
             elif ndim == 3:
-                # Bounds for 2-d coordinates
-                #
-                # E.g. if the esmpy.Grid is (X, Y) then for bounds <CF
-                #      Bounds: latitude(96, 73, 2) degrees_north> with
-                #      a non-cyclic X axis, we create a new bounds
-                #      array with shape (97, 74).
-                #
-                #      Note that if the X axis were cyclic, then the
-                #      new bounds array would have shape (96, 74).
-                n, m = b.shape[:2]
-                if spherical and cyclic:
-                    tmp = np.empty((n, m + 1), dtype=b.dtype)
-                    tmp[:, :m] = b[:, :, 0]
-                    if dim == lon:
-                        tmp[:, m] = b[:, -1, 0]
-                    else:
-                        tmp[:, m] = b[:, -1, 1]
-                else:
-                    tmp = np.empty((n + 1, m + 1), dtype=b.dtype)
-                    tmp[:n, :m] = b[:, :, 0]
-                    tmp[:n, m] = b[:, -1, 1]
-                    tmp[n, :m] = b[-1, :, 3]
-                    tmp[n, m] = b[-1, -1, 2]
-
-                if n_axes == 3:
-                    tmp = tmp.reshape(tmp.shape + (1,))
-
+                # Bounds for 2-d coordinates. These get written
+                # directly into the esmpy.Grid corners (see below),
+                # rather than into an intermediate array.
+                tmp = b
+                bounds_2d.append(dim)
             elif ndim == 4:
                 # Bounds for 3-d coordinates
                 raise ValueError(
@@ -2036,26 +2209,13 @@ def create_esmpy_grid(grid, mask=None):
 
             bounds[dim] = tmp
 
-    # Define the esmpy.Grid stagger locations. For details see
-    #
-    # 2-d:
-    # https://earthsystemmodeling.org/docs/release/latest/ESMF_refdoc/node5.html#fig:gridstaggerloc2d
-    #
-    # 3-d:
-    # https://earthsystemmodeling.org/docs/release/latest/ESMF_refdoc/node5.html#fig:gridstaggerloc3d
+    # Define the esmpy.Grid stagger locations. Corners are only needed
+    # when there are bounds.
+    centre_staggerloc, corner_staggerloc = esmpy_staggerlocs[n_axes]
     if bounds:
-        if n_axes == 3:
-            staggerlocs = [
-                esmpy.StaggerLoc.CENTER_VCENTER,
-                esmpy.StaggerLoc.CORNER_VFACE,
-            ]
-        else:
-            staggerlocs = [esmpy.StaggerLoc.CORNER, esmpy.StaggerLoc.CENTER]
+        staggerlocs = [centre_staggerloc, corner_staggerloc]
     else:
-        if n_axes == 3:
-            staggerlocs = [esmpy.StaggerLoc.CENTER_VCENTER]
-        else:
-            staggerlocs = [esmpy.StaggerLoc.CENTER]
+        staggerlocs = [centre_staggerloc]
 
     # Create an empty esmpy.Grid
     esmpy_grid = esmpy.Grid(
@@ -2068,27 +2228,43 @@ def create_esmpy_grid(grid, mask=None):
 
     # Populate the esmpy.Grid centres
     for dim, c in enumerate(coords):
-        if n_axes == 3:
-            grid_centre = esmpy_grid.get_coords(
-                dim, staggerloc=esmpy.StaggerLoc.CENTER_VCENTER
-            )
-        else:
-            grid_centre = esmpy_grid.get_coords(
-                dim, staggerloc=esmpy.StaggerLoc.CENTER
-            )
-
+        grid_centre = esmpy_grid.get_coords(dim, staggerloc=centre_staggerloc)
         grid_centre[...] = c
 
     # Populate the esmpy.Grid corners
     if bounds:
-        if n_axes == 3:
-            staggerloc = esmpy.StaggerLoc.CORNER_VFACE
-        else:
-            staggerloc = esmpy.StaggerLoc.CORNER
-
         for dim, b in enumerate(bounds):
-            grid_corner = esmpy_grid.get_coords(dim, staggerloc=staggerloc)
-            grid_corner[...] = b
+            grid_corner = esmpy_grid.get_coords(
+                dim, staggerloc=corner_staggerloc
+            )
+            if dim not in bounds_2d:
+                grid_corner[...] = b
+                continue
+
+            # Bounds for 2-d coordinates
+            #
+            # E.g. if the esmpy.Grid is (X, Y) then for bounds <CF
+            #      Bounds: latitude(96, 73, 2) degrees_north> with a
+            #      non-cyclic X axis, the grid corners have shape
+            #      (97, 74).
+            #
+            #      Note that if the X axis were cyclic, then the grid
+            #      corners would have shape (96, 74).
+            n, m = b.shape[:2]
+            if n_axes == 3:
+                # Broadcast the corners across the Z axis
+                b = np.expand_dims(b, 2)
+
+            grid_corner[:n, :m] = b[:, :, ..., 0]
+            if spherical and cyclic:
+                if dim == lon:
+                    grid_corner[:, m] = b[:, -1, ..., 0]
+                else:
+                    grid_corner[:, m] = b[:, -1, ..., 1]
+            else:
+                grid_corner[:n, m] = b[:, -1, ..., 1]
+                grid_corner[n, :m] = b[-1, :, ..., 3]
+                grid_corner[n, m] = b[-1, -1, ..., 2]
 
     # Add an esmpy.Grid mask
     if mask is not None:
@@ -2111,7 +2287,12 @@ def create_esmpy_grid(grid, mask=None):
             # Note: 'mask' has True/False for masked/unmasked
             #       elements, but the esmpy mask requires 0/1 for
             #       masked/unmasked elements.
-            grid_mask[...] = np.invert(mask).astype("int32")
+            #
+            # Performance note: The inverted Boolean mask is cast to
+            #                   int32 as it is written into the esmpy
+            #                   mask array, which avoids creating an
+            #                   intermediate int32 copy.
+            grid_mask[...] = ~mask
 
     return esmpy_grid
 
@@ -2201,13 +2382,20 @@ def create_esmpy_mesh(grid, mask=None):
                 f"Got: dtype={mask.dtype}"
             )
 
-        # Note: 'mask' has True/False for masked/unmasked elements,
-        #       but the esmpy mask requires 0/1 for masked/unmasked
-        #       elements.
-        mask = np.invert(mask).astype("int32")
-        if mask.all():
+        if not mask.any():
             # There are no masked elements
             mask = None
+        else:
+            # Note: 'mask' has True/False for masked/unmasked
+            #       elements, but the esmpy mask requires 0/1 for
+            #       masked/unmasked elements.
+            #
+            # Performance note: The int32 esmpy mask is created in a
+            #                   single pass, without an intermediate
+            #                   Boolean copy.
+            mask = np.logical_not(
+                mask, out=np.empty(mask.shape, dtype="int32"), casting="unsafe"
+            )
 
     # Add elements. This must be done after `add_nodes`.
     #
@@ -2280,7 +2468,9 @@ def create_esmpy_locstream(grid, mask=None):
         # Note: 'mask' has True/False for masked/unmasked elements,
         #       but the esmpy mask requires 0/1 for masked/unmasked
         #       elements.
-        mask = np.invert(mask).astype("int32")
+        mask = np.logical_not(
+            mask, out=np.empty(mask.shape, dtype="int32"), casting="unsafe"
+        )
     else:
         # No masked points
         mask = np.full((location_count,), 1, dtype="int32")
@@ -2393,160 +2583,172 @@ def create_esmpy_weights(
             col = None
 
     from_file = True
-    if compute_weights or esmpy_regrid_operator is not None:
-        # Create the weights using ESMF
-        from_file = False
-
-        src_mesh_location = src_grid.mesh_location
-        if src_mesh_location == "face":
-            src_meshloc = esmpy.api.constants.MeshLoc.ELEMENT
-        elif src_mesh_location == "point":
-            src_meshloc = esmpy.api.constants.MeshLoc.NODE
-        elif not src_mesh_location:
-            src_meshloc = None
-
-        dst_mesh_location = dst_grid.mesh_location
-        if dst_mesh_location == "face":
-            dst_meshloc = esmpy.api.constants.MeshLoc.ELEMENT
-        elif dst_mesh_location == "point":
-            dst_meshloc = esmpy.api.constants.MeshLoc.NODE
-        elif not dst_mesh_location:
-            dst_meshloc = None
-
-        src_esmpy_field = esmpy.Field(
-            src_esmpy_grid, name="src", meshloc=src_meshloc
-        )
-        dst_esmpy_field = esmpy.Field(
-            dst_esmpy_grid, name="dst", meshloc=dst_meshloc
-        )
-
-        mask_values = np.array([0], dtype="int32")
-
-        # Create the esmpy.Regrid operator
-        r = esmpy.Regrid(
-            src_esmpy_field,
-            dst_esmpy_field,
-            regrid_method=esmpy_methods.get(method),
-            unmapped_action=esmpy.UnmappedAction.IGNORE,
-            ignore_degenerate=bool(ignore_degenerate),
-            src_mask_values=mask_values,
-            dst_mask_values=mask_values,
-            norm_type=esmpy.api.constants.NormType.FRACAREA,
-            factors=True,
-        )
-
-        weights = r.get_weights_dict(deep_copy=True)
-        row = weights["row_dst"]
-        col = weights["col_src"]
-        weights = weights["weights"]
-
-        if quarter:
-            # The weights were created with a dummy size 2 dimension
-            # such that the weights for each dummy axis element are
-            # identical. The duplicate weights need to be removed.
-            #
-            # To do this, only retain the indices that correspond to
-            # the top left quarter of the weights matrix in dense
-            # form. I.e. if w is the NxM dense form of the weights (N,
-            # M both even), then this is equivalent to w[:N//2,
-            # :M//2].
-            index = np.where(
-                (row <= dst_esmpy_field.data.size // 2)
-                & (col <= src_esmpy_field.data.size // 2)
+    src_esmpy_field = None
+    dst_esmpy_field = None
+    r = None
+    try:
+        if compute_weights or esmpy_regrid_operator is not None:
+            # Create the weights using ESMF
+            from_file = False
+
+            src_mesh_location = src_grid.mesh_location
+            if src_mesh_location == "face":
+                src_meshloc = esmpy.api.constants.MeshLoc.ELEMENT
+            elif src_mesh_location == "point":
+                src_meshloc = esmpy.api.constants.MeshLoc.NODE
+            elif not src_mesh_location:
+                src_meshloc = None
+
+            dst_mesh_location = dst_grid.mesh_location
+            if dst_mesh_location == "face":
+                dst_meshloc = esmpy.api.constants.MeshLoc.ELEMENT
+            elif dst_mesh_location == "point":
+                dst_meshloc = esmpy.api.constants.MeshLoc.NODE
+            elif not dst_mesh_location:
+                dst_meshloc = None
+
+            src_esmpy_field = esmpy.Field(
+                src_esmpy_grid, name="src", meshloc=src_meshloc
+            )
+            dst_esmpy_field = esmpy.Field(
+                dst_esmpy_grid, name="dst", meshloc=dst_meshloc
             )
-            weights = weights[index]
-            row = row[index]
-            col = col[index]
-
-        if weights_file is not None:
-            # Write the weights to a netCDF file (copying the
-            # dimension and variable names and structure of a weights
-            # file created by ESMF).
-            from netCDF4 import Dataset
-
-            from .. import __version__
-            from ..data.array.netcdfarray import _lock
-
-            if (
-                max(dst_esmpy_field.data.size, src_esmpy_field.data.size)
-                <= np.iinfo("int32").max
-            ):
-                i_dtype = "i4"
-            else:
-                i_dtype = "i8"
-
-            upper_bounds = src_esmpy_grid.upper_bounds
-            if len(upper_bounds) > 1:
-                upper_bounds = upper_bounds[0]
 
-            src_shape = tuple(upper_bounds)
+            mask_values = np.array([0], dtype="int32")
+
+            # Create the esmpy.Regrid operator
+            r = esmpy.Regrid(
+                src_esmpy_field,
+                dst_esmpy_field,
+                regrid_method=esmpy_methods.get(method),
+                unmapped_action=esmpy.UnmappedAction.IGNORE,
+                ignore_degenerate=bool(ignore_degenerate),
+                src_mask_values=mask_values,
+                dst_mask_values=mask_values,
+                norm_type=esmpy.api.constants.NormType.FRACAREA,
+                factors=True,
+            )
 
-            upper_bounds = dst_esmpy_grid.upper_bounds
-            if len(upper_bounds) > 1:
-                upper_bounds = upper_bounds[0]
+            weights = r.get_weights_dict(deep_copy=True)
+            row = weights["row_dst"]
+            col = weights["col_src"]
+            weights = weights["weights"]
 
-            dst_shape = tuple(upper_bounds)
+            if quarter:
+                # The weights were created with a dummy size 2 dimension
+                # such that the weights for each dummy axis element are
+                # identical. The duplicate weights need to be removed.
+                #
+                # To do this, only retain the indices that correspond to
+                # the top left quarter of the weights matrix in dense
+                # form. I.e. if w is the NxM dense form of the weights (N,
+                # M both even), then this is equivalent to w[:N//2,
+                # :M//2].
+                index = np.where(
+                    (row <= dst_esmpy_field.data.size // 2)
+                    & (col <= src_esmpy_field.data.size // 2)
+                )
+                weights = weights[index]
+                row = row[index]
+                col = col[index]
+
+            if weights_file is not None:
+                # Write the weights to a netCDF file (copying the
+                # dimension and variable names and structure of a weights
+                # file created by ESMF).
+                from netCDF4 import Dataset
+
+                from .. import __version__
+                from ..data.array.netcdfarray import _lock
+
+                if (
+                    max(dst_esmpy_field.data.size, src_esmpy_field.data.size)
+                    <= np.iinfo("int32").max
+                ):
+                    i_dtype = "i4"
+                else:
+                    i_dtype = "i8"
 
-            regrid_method = f"{src_grid.coord_sys} {src_grid.method}"
-            if src_grid.ln_z:
-                regrid_method += f", ln {src_grid.method} in vertical"
+                upper_bounds = src_esmpy_grid.upper_bounds
+                if len(upper_bounds) > 1:
+                    upper_bounds = upper_bounds[0]
 
-            _lock.acquire()
-            nc = Dataset(weights_file, "w", format="NETCDF4")
+                src_shape = tuple(upper_bounds)
 
-            nc.title = (
-                f"Regridding weights from source {src_grid.type} "
-                f"with shape {src_shape} to destination "
-                f"{dst_grid.type} with shape {dst_shape}"
-            )
-            nc.source = f"cf v{__version__}, esmpy v{esmpy.__version__}"
-            nc.history = f"Created at {datetime.now()}"
-            nc.regrid_method = regrid_method
-            nc.ESMF_unmapped_action = r.unmapped_action
-            nc.ESMF_ignore_degenerate = int(r.ignore_degenerate)
+                upper_bounds = dst_esmpy_grid.upper_bounds
+                if len(upper_bounds) > 1:
+                    upper_bounds = upper_bounds[0]
 
-            nc.createDimension("n_s", weights.size)
-            nc.createDimension("src_grid_rank", src_esmpy_grid.rank)
-            nc.createDimension("dst_grid_rank", dst_esmpy_grid.rank)
+                dst_shape = tuple(upper_bounds)
 
-            v = nc.createVariable("src_grid_dims", i_dtype, ("src_grid_rank",))
-            v.long_name = "Source grid shape"
-            v[...] = src_shape
+                regrid_method = f"{src_grid.coord_sys} {src_grid.method}"
+                if src_grid.ln_z:
+                    regrid_method += f", ln {src_grid.method} in vertical"
 
-            v = nc.createVariable("dst_grid_dims", i_dtype, ("dst_grid_rank",))
-            v.long_name = "Destination grid shape"
-            v[...] = dst_shape
+                _lock.acquire()
+                try:
+                    nc = Dataset(weights_file, "w", format="NETCDF4")
 
-            v = nc.createVariable("S", weights.dtype, ("n_s",))
-            v.long_name = "Weights values"
-            v[...] = weights
+                    nc.title = (
+                        f"Regridding weights from source {src_grid.type} "
+                        f"with shape {src_shape} to destination "
+                        f"{dst_grid.type} with shape {dst_shape}"
+                    )
+                    nc.source = (
+                        f"cf v{__version__}, esmpy v{esmpy.__version__}"
+                    )
+                    nc.history = f"Created at {datetime.now()}"
+                    nc.regrid_method = regrid_method
+                    nc.ESMF_unmapped_action = r.unmapped_action
+                    nc.ESMF_ignore_degenerate = int(r.ignore_degenerate)
 
-            v = nc.createVariable("row", i_dtype, ("n_s",), zlib=True)
-            v.long_name = "Destination/row indices"
-            v.start_index = start_index
-            v[...] = row
+                    nc.createDimension("n_s", weights.size)
+                    nc.createDimension("src_grid_rank", src_esmpy_grid.rank)
+                    nc.createDimension("dst_grid_rank", dst_esmpy_grid.rank)
 
-            v = nc.createVariable("col", i_dtype, ("n_s",), zlib=True)
-            v.long_name = "Source/col indices"
-            v.start_index = start_index
-            v[...] = col
+                    v = nc.createVariable(
+                        "src_grid_dims", i_dtype, ("src_grid_rank",)
+                    )
+                    v.long_name = "Source grid shape"
+                    v[...] = src_shape
 
-            nc.close()
-            _lock.release()
+                    v = nc.createVariable(
+                        "dst_grid_dims", i_dtype, ("dst_grid_rank",)
+                    )
+                    v.long_name = "Destination grid shape"
+                    v[...] = dst_shape
+
+                    v = nc.createVariable("S", weights.dtype, ("n_s",))
+                    v.long_name = "Weights values"
+                    v[...] = weights
+
+                    v = nc.createVariable("row", i_dtype, ("n_s",), zlib=True)
+                    v.long_name = "Destination/row indices"
+                    v.start_index = start_index
+                    v[...] = row
+
+                    v = nc.createVariable("col", i_dtype, ("n_s",), zlib=True)
+                    v.long_name = "Source/col indices"
+                    v.start_index = start_index
+                    v[...] = col
+
+                    nc.close()
+                finally:
+                    _lock.release()
+    except BaseException:
+        # Make sure that the esmpy objects don't leak when the weights
+        # couldn't be created
+        esmpy_destroy(
+            r, src_esmpy_field, dst_esmpy_field, src_esmpy_grid, dst_esmpy_grid
+        )
+        raise
 
     if esmpy_regrid_operator is None:
         # Destroy esmpy objects (the esmpy.Grid objects exist even if
         # we didn't create any weights using esmpy.Regrid).
-        src_esmpy_grid.destroy()
-        dst_esmpy_grid.destroy()
-        if compute_weights:
-            src_esmpy_field.destroy()
-            dst_esmpy_field.destroy()
-            r.srcfield.grid.destroy()
-            r.srcfield.destroy()
-            r.dstfield.grid.destroy()
-            r.dstfield.destroy()
-            r.destroy()
+        esmpy_destroy(
+            r, src_esmpy_field, dst_esmpy_field, src_esmpy_grid, dst_esmpy_grid
+        )
     else:
         # Make the Regrid instance available via the
         # 'esmpy_regrid_operator' list
@@ -2555,6 +2757,317 @@ def create_esmpy_weights(
     return weights, row, col, start_index, from_file
 
 
+def esmpy_destroy(*objects):
+    """Destroy `esmpy` objects, releasing their memory.
+
+    Every object is destroyed, even if destroying an earlier one
+    fails.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `create_esmpy_weights`
+
+    :Parameters:
+
+        objects:
+            The `esmpy` objects to destroy, such as `esmpy.Regrid`,
+            `esmpy.Field` and `esmpy.Grid` instances. `None` values
+            are ignored.
+
+    :Returns:
+
+        `None`
+
+    """
+    for obj in objects:
+        if obj is None:
+            continue
+
+        try:
+            obj.destroy()
+        except Exception:
+            # An object that can't be destroyed (e.g. because it has
+            # already been destroyed) must not prevent the remaining
+            # objects from being destroyed.
+            pass
+
+
+def array_digest(a):
+    """Return a digest of the values of an array.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `grid_fingerprint`
+
+    :Parameters:
+
+        a: array_like or `None`
+            The array. May be a `numpy` array, a `numpy` masked array,
+            or any object (such as a construct) which can be converted
+            to a `numpy` array.
+
+    :Returns:
+
+        `tuple`
+            The digest, which comprises the array's shape, data type,
+            units (if any), and a hash of its values and mask.
+
+    """
+    if a is None:
+        return None
+
+    units = getattr(a, "Units", None)
+    if units is not None:
+        units = str(units)
+
+    a = np.asanyarray(a)
+    h = blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(np.ma.getdata(a)).tobytes())
+    if np.ma.is_masked(a):
+        h.update(np.ascontiguousarray(np.ma.getmaskarray(a)).tobytes())
+
+    return (a.shape, a.dtype.str, units, h.digest())
+
+
+def grid_fingerprint(grid, mask=None):
+    """Return a fingerprint of a grid for the regridding weights cache.
+
+    Two grids with equal fingerprints are guaranteed to produce the
+    same `esmpy` regridding weights.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `weights_cache_key`
+
+    :Parameters:
+
+        grid: `Grid`
+            The definition of the source or destination grid.
+
+        mask: array_like or `None`, optional
+            The grid mask that is passed to `create_esmpy_grid`.
+
+    :Returns:
+
+        `tuple`
+            The fingerprint.
+
+    """
+    domain_topology = grid.domain_topology
+    if domain_topology is not None:
+        domain_topology = array_digest(domain_topology)
+
+    return (
+        grid.coord_sys,
+        grid.type,
+        tuple(grid.shape),
+        grid.cyclic,
+        grid.mesh_location,
+        grid.featureType,
+        grid.dummy_size_2_dimension,
+        tuple(array_digest(c) for c in grid.coords),
+        tuple(array_digest(b) for b in grid.bounds),
+        domain_topology,
+        array_digest(mask),
+    )
+
+
+def weights_cache_key(
+    method, src_grid, dst_grid, src_mask, dst_mask, ignore_degenerate
+):
+    """Return the regridding weights cache key.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cache_weights`, `get_cached_weights`
+
+    :Parameters:
+
+        method: `str`
+            The regridding method.
+
+        src_grid: `Grid`
+            The definition of the source grid.
+
+        dst_grid: `Grid`
+            The definition of the destination grid.
+
+        src_mask: array_like or `None`
+            The source grid mask used to create the weights.
+
+        dst_mask: array_like or `None`
+            The destination grid mask used to create the weights.
+
+        ignore_degenerate: `bool`
+            Whether or not degenerate cells are ignored.
+
+    :Returns:
+
+        `tuple`
+            The cache key.
+
+    """
+    return (
+        method,
+        bool(ignore_degenerate),
+        grid_fingerprint(src_grid, src_mask),
+        grid_fingerprint(dst_grid, dst_mask),
+    )
+
+
+def get_cached_weights(key):
+    """Get regridding weights from the cache.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cache_weights`, `weights_cache_key`
+
+    :Parameters:
+
+        key: `tuple` or `None`
+            The cache key, as returned by `weights_cache_key`. If
+            `None` then `None` is returned.
+
+    :Returns:
+
+        4-`tuple` or `None`
+            The cached weights, row indices, column indices and start
+            index (see `create_esmpy_weights`), or `None` if there
+            are no cached weights for the key.
+
+    """
+    if key is None:
+        return None
+
+    value = _weights_cache.get(key)
+    if value is not None:
+        _weights_cache.move_to_end(key)
+        logger.debug("Using cached regridding weights")  # pragma: no cover
+
+    return value
+
+
+def cache_weights(key, weights, row, col, start_index):
+    """Store regridding weights in the cache.
+
+    The cached arrays are made read-only, so that they may be safely
+    shared between regrid operators.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `get_cached_weights`, `weights_cache_key`
+
+    :Parameters:
+
+        key: `tuple` or `None`
+            The cache key, as returned by `weights_cache_key`. If
+            `None` then nothing is cached.
+
+        weights, row, col: `numpy.ndarray`
+            The weights and their row and column indices, as returned
+            by `create_esmpy_weights`.
+
+        start_index: `int`
+            The start index of the row and column indices.
+
+    :Returns:
+
+        `None`
+
+    """
+    if key is None or weights is None:
+        return
+
+    maxsize = regrid_weights_cache_size().value
+    if weights.nbytes + row.nbytes + col.nbytes > maxsize:
+        # Too large to ever fit in the cache
+        return
+
+    for a in (weights, row, col):
+        a.flags.writeable = False
+
+    _weights_cache[key] = (weights, row, col, start_index)
+    _weights_cache.move_to_end(key)
+    _evict_weights(maxsize)
+
+
+def _evict_weights(maxsize):
+    """Discard cached regridding weights until the cache is small enough.
+
+    The least recently used weights are discarded first.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cache_weights`, `cf.regrid_weights_cache_size`
+
+    :Parameters:
+
+        maxsize: `int`
+            The maximum total size of the cached weights, in bytes.
+
+    :Returns:
+
+        `None`
+
+    """
+    nbytes = weights_cache_info()["nbytes"]
+    while nbytes > maxsize:
+        _, (weights, row, col, _) = _weights_cache.popitem(last=False)
+        nbytes -= weights.nbytes + row.nbytes + col.nbytes
+
+
+def clear_weights_cache():
+    """Remove all regridding weights from the cache.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.regrid_weights_cache_size`, `weights_cache_info`
+
+    :Returns:
+
+        `None`
+
+    **Examples**
+
+    >>> cf.regrid.clear_weights_cache()
+    >>> cf.regrid.weights_cache_info()["entries"]
+    0
+
+    """
+    _weights_cache.clear()
+
+
+def weights_cache_info():
+    """Describe the contents of the regridding weights cache.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `clear_weights_cache`, `cf.regrid_weights_cache_size`
+
+    :Returns:
+
+        `dict`
+            The number of cached weights matrices (``'entries'``),
+            their total size in bytes (``'nbytes'``), and the maximum
+            size of the cache in bytes (``'maxsize'``).
+
+    **Examples**
+
+    >>> cf.regrid.weights_cache_info()
+    {'entries': 2, 'nbytes': 1297152, 'maxsize': 524288000}
+
+    """
+    nbytes = sum(
+        weights.nbytes + row.nbytes + col.nbytes
+        for weights, row, col, _ in _weights_cache.values()
+    )
+    return {
+        "entries": len(_weights_cache),
+        "nbytes": nbytes,
+        "maxsize": regrid_weights_cache_size().value,
+    }
+
+
 def contiguous_bounds(b, cyclic=False, period=None):
     """Determine whether or not bounds are contiguous.
 
@@ -2579,13 +3092,7 @@ def contiguous_bounds(b, cyclic=False, period=None):
     ndim = b.ndim - 1
     if ndim == 1:
         # 1-d cells
-        diff = b[1:, 0] - b[:-1, 1]
-        if cyclic:
-            diff = diff % period
-
-        if diff.any():
-            return False
-
+        pairs = ((b[1:, 0], b[:-1, 1]),)
     elif ndim == 2:
         # 2-d cells
         nbounds = b.shape[-1]
@@ -2595,34 +3102,27 @@ def contiguous_bounds(b, cyclic=False, period=None):
                 "are contiguous"
             )
 
-        # Check cells (j, i) and cells (j, i+1) are contiguous
-        diff = b[:, :-1, 1] - b[:, 1:, 0]
-        if cyclic:
-            diff = diff % period
-
-        if diff.any():
-            return False
-
-        diff = b[:, :-1, 2] - b[:, 1:, 3]
-        if cyclic:
-            diff = diff % period
-
-        if diff.any():
-            return False
-
-        # Check cells (j, i) and (j+1, i) are contiguous
-        diff = b[:-1, :, 3] - b[1:, :, 0]
-        if cyclic:
-            diff = diff % period
-
-        if diff.any():
-            return False
+        pairs = (
+            # Check cells (j, i) and cells (j, i+1) are contiguous
+            (b[:, :-1, 1], b[:, 1:, 0]),
+            (b[:, :-1, 2], b[:, 1:, 3]),
+            # Check cells (j, i) and (j+1, i) are contiguous
+            (b[:-1, :, 3], b[1:, :, 0]),
+            (b[:-1, :, 2], b[1:, :, 1]),
+        )
+    else:
+        return True
 
-        diff = b[:-1, :, 2] - b[1:, :, 1]
+    # Performance note: Each pair of adjacent cell vertices is
+    #                   compared via views of the bounds, so that at
+    #                   most one temporary array is created per pair.
+    for x, y in pairs:
         if cyclic:
-            diff = diff % period
-
-        if diff.any():
+            diff = x - y
+            diff %= period
+            if diff.any():
+                return False
+        elif (x != y).any():
             return False
 
     return True
@@ -2690,7 +3190,7 @@ def conservative_regridding(method):
             conservative. Otherwise False.
 
     """
-    return method in ("conservative", "conservative_1st", "conservative_2nd")
+    return method in conservative_methods
 
 
 def get_mask(f, grid):
@@ -2716,12 +3216,19 @@ def get_mask(f, grid):
 
     index = [slice(None) if i in regrid_axes else 0 for i in range(f.ndim)]
 
-    mask = da.ma.getmaskarray(f.data.to_dask_array())
-    mask = mask[tuple(index)]
+    # Performance note: Subspace the data before finding its mask,
+    #                   so that only the chunks that contain the first
+    #                   regridding slice need to be read.
+    mask = f.data.to_dask_array()[tuple(index)]
+    mask = da.ma.getmaskarray(mask)
 
-    # Reorder the mask axes to grid.axis_keys
-    axes = np.argsort(regrid_axes).tolist()
-    if len(axes) > 1:
+    # Reorder the mask axes to grid.axis_keys.
+    #
+    # Performance note: `da.transpose` always adds a new layer to the
+    #                   graph, even for the identity permutation, so
+    #                   only call it when the axes are out of order.
+    axes = sorted(range(len(regrid_axes)), key=regrid_axes.__getitem__)
+    if axes != list(range(len(axes))):
         mask = da.transpose(mask, axes=axes)
 
     return mask
@@ -2858,6 +3365,12 @@ def update_non_coordinates(src, dst, src_grid, dst_grid, regrid_operator):
     src_axis_keys = src_grid.axis_keys
     dst_axis_keys = dst_grid.axis_keys
 
+    # Performance note: The axis key sets are created once here,
+    #                   rather than once per construct in the loops
+    #                   below.
+    src_axis_set = frozenset(src_axis_keys)
+    dst_axis_set = frozenset(dst_axis_keys)
+
     # Initialise cached value for domain_axes
     domain_axes = None
 
@@ -2869,11 +3382,11 @@ def update_non_coordinates(src, dst, src_grid, dst_grid, regrid_operator):
     # domain ancillaries.
     # ----------------------------------------------------------------
     for ref_key, ref in src.coordinate_references(todict=True).items():
-        ref_axes = []
-        for c_key in ref.coordinates():
-            ref_axes.extend(data_axes[c_key])
-
-        if set(ref_axes).intersection(src_axis_keys):
+        if any(
+            axis in src_axis_set
+            for c_key in ref.coordinates()
+            for axis in data_axes[c_key]
+        ):
             src.del_coordinate_reference(ref_key)
 
     # ----------------------------------------------------------------
@@ -2898,12 +3411,12 @@ def update_non_coordinates(src, dst, src_grid, dst_grid, regrid_operator):
 
         # Ignore any remaining source domain ancillary that spans none
         # of the regridding axes
-        if not set(da_axes).intersection(src_axis_keys):
+        if src_axis_set.isdisjoint(da_axes):
             continue
 
         # Delete any any remaining source domain ancillary that spans
         # some but not all of the regridding axes
-        if not set(da_axes).issuperset(src_axis_keys):
+        if not src_axis_set.issubset(da_axes):
             src.del_construct(da_key)
             continue
 
@@ -2955,7 +3468,7 @@ def update_non_coordinates(src, dst, src_grid, dst_grid, regrid_operator):
         for c_key in ref.coordinates():
             axes.update(dst_data_axes[c_key])
 
-        if axes and set(axes).issubset(dst_axis_keys):
+        if axes and axes.issubset(dst_axis_set):
             src.set_coordinate_reference(ref, parent=dst, strict=True)
 
 
@@ -203,8 +203,8 @@ class RegridOperator(mixin_Container, Container):
         self._set_component("col", col, copy=False)
         self._set_component("coord_sys", coord_sys, copy=False)
         self._set_component("method", method, copy=False)
-        self._set_component("src_mask", src_mask, copy=False)
-        self._set_component("dst_mask", dst_mask, copy=False)
+        self._set_mask("src_mask", src_mask)
+        self._set_mask("dst_mask", dst_mask)
         self._set_component("src_cyclic", bool(src_cyclic), copy=False)
         self._set_component("dst_cyclic", bool(dst_cyclic), copy=False)
         self._set_component("src_shape", tuple(src_shape), copy=False)
@@ -231,6 +231,65 @@ class RegridOperator(mixin_Container, Container):
             f"<CF {self.__class__.__name__}: {self.coord_sys} {self.method}>"
         )
 
+    def _get_mask(self, mask_name):
+        """Return a grid mask, unpacking it if necessary.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `_set_mask`
+
+        :Parameters:
+
+            mask_name: `str`
+                The name of the mask component, i.e. ``'src_mask'`` or
+                ``'dst_mask'``.
+
+        :Returns:
+
+            `numpy.ndarray` or `None`
+                The mask.
+
+        """
+        mask = self._get_component(mask_name)
+        if isinstance(mask, tuple):
+            from math import prod
+
+            packed, shape = mask
+            mask = np.unpackbits(packed, count=prod(shape))
+            mask = mask.view(bool).reshape(shape)
+
+        return mask
+
+    def _set_mask(self, mask_name, mask):
+        """Set a grid mask, packing it if possible.
+
+        Boolean `numpy` arrays are stored as bit-packed arrays, which
+        use one eighth of the memory. Any other mask is stored
+        unchanged.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `_get_mask`
+
+        :Parameters:
+
+            mask_name: `str`
+                The name of the mask component, i.e. ``'src_mask'`` or
+                ``'dst_mask'``.
+
+            mask: `numpy.ndarray` or `None`
+                The mask.
+
+        :Returns:
+
+            `None`
+
+        """
+        if isinstance(mask, np.ndarray) and mask.dtype == bool:
+            mask = (np.packbits(mask, axis=None), mask.shape)
+
+        self._set_component(mask_name, mask, copy=False)
+
     @property
     def col(self):
         """The 1-d array of the column indices of the regridding
@@ -308,10 +367,14 @@ class RegridOperator(mixin_Container, Container):
         operation. The mask must have shape `!dst_shape`, and a value
         of `True` signifies a masked destination grid cell.
 
+        The mask is stored bit-packed, and each access unpacks it into
+        a new array, so changes to the returned array are not written
+        back to the regrid operator.
+
         .. versionadded:: 3.14.0
 
         """
-        return self._get_component("dst_mask")
+        return self._get_mask("dst_mask")
 
     @property
     def dst_mesh_location(self):
@@ -437,10 +500,14 @@ class RegridOperator(mixin_Container, Container):
         is the source grid mask that was used during the creation of
         the *weights*.
 
+        The mask is stored bit-packed, and each access unpacks it into
+        a new array, so changes to the returned array are not written
+        back to the regrid operator.
+
         .. versionadded:: 3.14.0
 
         """
-        return self._get_component("src_mask")
+        return self._get_mask("src_mask")
 
     @property
     def src_mesh_location(self):
@@ -686,7 +753,9 @@ class RegridOperator(mixin_Container, Container):
         The `weights` attribute is set to a Compressed Sparse Row
         (CSR) array (i.e. a `scipy.sparse._arrays.csr_array` instance)
         that combines the weights and the row and column indices, and
-        the `row` and `col` attributes are set to `None`.
+        the `row` and `col` attributes are set to `None`. The CSR
+        index arrays are 32-bit integers whenever the grid sizes
+        allow it.
 
         The `dst_mask` attribute is also updated to `True` for
         destination grid points for which the weights are all zero.
@@ -768,6 +837,13 @@ class RegridOperator(mixin_Container, Container):
         src_size = prod(self.src_shape)
         dst_size = prod(self.dst_shape)
 
+        # Use 32-bit integer indices whenever possible, which halves
+        # the memory used by the index arrays compared to 64-bit
+        # integers.
+        if max(src_size, dst_size) <= np.iinfo("int32").max:
+            row = row.astype("int32", copy=False)
+            col = col.astype("int32", copy=False)
+
         weights = csr_array((weights, (row, col)), shape=[dst_size, src_size])
 
         self._set_component("weights", weights, copy=False)
@@ -793,19 +869,14 @@ class RegridOperator(mixin_Container, Container):
 
         # Performance note:
         #
-        # It is much more efficient to access 'weights.indptr' and
-        # 'weights.data' directly, rather than iterating over rows of
-        # 'weights' and using 'weights.getrow'.
-
-        indptr = weights.indptr.tolist()
-        data = weights.data
-        for j, (i0, i1) in enumerate(zip(indptr[:-1], indptr[1:])):
-            if not data[i0:i1].size:
-                dst_mask[j] = True
+        # It is much more efficient to find the empty rows from
+        # 'weights.indptr' directly, rather than iterating over rows
+        # of 'weights'.
+        dst_mask[np.diff(weights.indptr) == 0] = True
 
         if not dst_mask.any():
             dst_mask = None
         else:
             dst_mask = dst_mask.reshape(self.dst_shape)
 
-        self._set_component("dst_mask", dst_mask, copy=False)
+        self._set_mask("dst_mask", dst_mask)
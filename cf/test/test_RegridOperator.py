@@ -4,6 +4,8 @@ import unittest
 
 faulthandler.enable()  # to debug seg faults and timeouts
 
+import numpy as np
+
 import cf
 
 
@@ -42,6 +44,32 @@ class RegridOperatorTest(unittest.TestCase):
     def test_RegridOperator_copy(self):
         self.assertIsInstance(self.r.copy(), self.r.__class__)
 
+    def test_RegridOperator_mask(self):
+        r = self.r.copy()
+
+        rng = np.random.default_rng(0)
+        for mask in (
+            rng.random((3, 4, 5)) > 0.5,
+            np.zeros((3, 4, 5), dtype=bool),
+            np.array(False),
+            np.array(True),
+        ):
+            for name in ("src_mask", "dst_mask"):
+                r._set_mask(name, mask)
+                m = getattr(r, name)
+                self.assertEqual(m.dtype, bool)
+                self.assertEqual(m.shape, mask.shape)
+                self.assertTrue((m == mask).all())
+
+                # Changing the returned mask doesn't change the stored
+                # mask
+                m[...] = ~m
+                self.assertTrue((getattr(r, name) == mask).all())
+
+        for name in ("src_mask", "dst_mask"):
+            r._set_mask(name, None)
+            self.assertIsNone(getattr(r, name))
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -58,7 +58,7 @@ class functionTest(unittest.TestCase):
         self.assertIsInstance(org, dict)
 
         # Check all keys that should be there are, with correct value type:
-        self.assertEqual(len(org), 8)  # update expected len if add new key(s)
+        self.assertEqual(len(org), 9)  # update expected len if add new key(s)
 
         # Types expected:
         self.assertIsInstance(org["atol"], float)
@@ -67,6 +67,7 @@ class functionTest(unittest.TestCase):
         self.assertIsInstance(org["relaxed_identities"], bool)
         self.assertIsInstance(org["bounds_combination_mode"], str)
         self.assertIsInstance(org["regrid_logging"], bool)
+        self.assertIsInstance(org["regrid_weights_cache_size"], int)
         self.assertIsInstance(org["tempdir"], str)
         # Log level may be input as an int but always given as
         # equiv. string
@@ -83,6 +84,7 @@ class functionTest(unittest.TestCase):
             "tempdir": "/my-custom-tmpdir",
             #            "free_memory_factor": 0.25,
             "regrid_logging": True,
+            "regrid_weights_cache_size": 2**20,
             "relaxed_identities": True,
             "bounds_combination_mode": "XOR",
             "log_level": "INFO",
@@ -233,6 +235,21 @@ class functionTest(unittest.TestCase):
             with org:
                 pass
 
+        # regrid_weights_cache_size
+        func = cf.regrid_weights_cache_size
+
+        org = func(2**20)
+        old = func()
+        new = "2 MiB"
+        with func(new):
+            self.assertEqual(func(), 2**21)
+
+        self.assertEqual(func(), old)
+        func(org)
+
+        with self.assertRaises(ValueError):
+            func(-1)
+
         # bounds_combination_mode
         func = cf.bounds_combination_mode
 
@@ -2,8 +2,10 @@ import atexit
 import datetime
 import faulthandler
 import os
+import sys
 import tempfile
 import unittest
+from unittest import mock
 
 faulthandler.enable()  # to debug seg faults and timeouts
 
@@ -97,9 +99,7 @@ def esmpy_regrid_1d(method, src, dst, **kwargs):
     array = src.array
     array = np.expand_dims(array, 1)
 
-    src_field.data[...] = np.ma.MaskedArray(array, copy=False).filled(
-        fill_value
-    )
+    src_field.data[...] = np.ma.filled(array, fill_value)
     dst_field.data[...] = fill_value
 
     esmpy_regrid(src_field, dst_field, zero_region=esmpy.Region.SELECT)
@@ -134,9 +134,7 @@ def esmpy_regrid_Nd(coord_sys, method, src, dst, **kwargs):
     dst_field = esmpy.Field(esmpy_regrid.dstfield.grid, "dst")
 
     fill_value = 1e20
-    src_field.data[...] = np.ma.MaskedArray(src.array, copy=False).filled(
-        fill_value
-    )
+    src_field.data[...] = np.ma.filled(src.array, fill_value)
 
     dst_field.data[...] = fill_value
 
@@ -750,6 +748,68 @@ class RegridTest(unittest.TestCase):
         z = d.dimension_coordinate("Z")
         self.assertTrue(z.data.equals(dst.data))
 
+    @unittest.skipUnless(esmpy_imported, "Requires esmpy/ESMF package.")
+    def test_Field_regrids_coords_z(self):
+        """3-d spherical regridding with coords destination grid."""
+        src = cf.read(self.filename_xyz)[0]
+        dst = src[:, [1, 3, 5]]
+
+        kwargs = {"method": "linear", "z": "air_pressure", "ln_z": True}
+
+        # Truth = destination grid defined by a field
+        d0 = src.regrids(dst, **kwargs)
+
+        x = dst.dimension_coordinate("X")
+        y = dst.dimension_coordinate("Y")
+        z = dst.dimension_coordinate("Z")
+
+        # Sequence of 1-d dimension coordinates, including 1-d Z
+        d1 = src.regrids([x, y, z], **kwargs)
+        self.assertTrue(d1.data.equals(d0.data, atol=atol, rtol=rtol))
+        self.assertTrue(d1.dimension_coordinate("Z").data.equals(z.data))
+
+        # Sequence of 2-d latitude and longitude, and 3-d Z,
+        # auxiliary coordinates
+        lat = np.empty((y.size, x.size))
+        lat[...] = y.array.reshape(y.size, 1)
+        lon = np.empty((y.size, x.size))
+        lon[...] = x.array
+
+        z_3d = np.empty((y.size, x.size, z.size))
+        z_3d[...] = z.array
+
+        def aux(array, coord):
+            c = cf.AuxiliaryCoordinate(data=cf.Data(array, units=coord.Units))
+            c.standard_name = coord.standard_name
+            return c
+
+        d1 = src.regrids(
+            [aux(lon, x), aux(lat, y), aux(z_3d, z)],
+            dst_axes={"X": 1, "Y": 0, "Z": 2},
+            **kwargs,
+        )
+        self.assertTrue(d1.data.equals(d0.data, atol=atol, rtol=rtol))
+
+        # As above, but with X as the first coordinate dimension
+        d1 = src.regrids(
+            [
+                aux(lon.T, x),
+                aux(lat.T, y),
+                aux(z_3d.transpose(1, 0, 2), z),
+            ],
+            dst_axes={"X": 0, "Y": 1, "Z": 2},
+            **kwargs,
+        )
+        self.assertTrue(d1.data.equals(d0.data, atol=atol, rtol=rtol))
+
+        # 2-d Z coordinates are not allowed
+        with self.assertRaises(ValueError):
+            src.regrids(
+                [aux(lon, x), aux(lat, y), aux(z_3d[..., 0], z)],
+                dst_axes={"X": 1, "Y": 0, "Z": 2},
+                **kwargs,
+            )
+
     @unittest.skipUnless(esmpy_imported, "Requires esmpy/ESMF package.")
     def test_Field_regrid_chunks(self):
         """Regridding of chunked axes"""
@@ -763,6 +823,16 @@ class RegridTest(unittest.TestCase):
         d0 = src.regrids(dst, method="linear")
         self.assertEqual(d0.data.numblocks, (1, 1, 1))
 
+        # The chunks of a multi-chunk non-regrid axis are preserved
+        dst, src = cf.read(
+            filename, chunks={"time": 1, "latitude": 20, "longitude": 30}
+        )
+        self.assertEqual(src.data.chunks, ((1, 1), (20, 10), (30, 18)))
+
+        d1 = src.regrids(dst, method="linear")
+        self.assertEqual(d1.data.chunks, ((1, 1), (73,), (96,)))
+        self.assertTrue(d1.equals(d0))
+
     @unittest.skipUnless(esmpy_imported, "Requires esmpy/ESMF package.")
     def test_Field_regrid_weights_file(self):
         """Regridding creation/use of weights file"""
@@ -810,6 +880,166 @@ class RegridTest(unittest.TestCase):
         self.assertIsInstance(opers, esmpy.api.regrid.Regrid)
         self.assertIsInstance(operc, esmpy.api.regrid.Regrid)
 
+    @unittest.skipUnless(esmpy_imported, "Requires esmpy/ESMF package.")
+    def test_Field_regrid_weights_cache(self):
+        """Regridding reuses cached weights"""
+        from cf.regrid import clear_weights_cache, weights_cache_info
+
+        dst = self.dst
+        src = self.src
+
+        regrid_module = sys.modules["cf.regrid.regrid"]
+
+        clear_weights_cache()
+        for method in ("linear", "conservative"):
+            r0 = src.regrids(dst, method=method, return_operator=True)
+            n_cached = weights_cache_info()["entries"]
+
+            # A cache hit doesn't create any new weights
+            with mock.patch.object(
+                regrid_module,
+                "create_esmpy_weights",
+                wraps=regrid_module.create_esmpy_weights,
+            ) as create_esmpy_weights:
+                r1 = src.regrids(dst, method=method, return_operator=True)
+                create_esmpy_weights.assert_not_called()
+
+            self.assertEqual(weights_cache_info()["entries"], n_cached)
+            self.assertEqual((r0.weights != r1.weights).nnz, 0)
+
+            x = src.regrids(dst, method=method)
+            y = src.regrids(r0)
+            self.assertTrue(x.equals(y))
+
+        info = weights_cache_info()
+        self.assertEqual(info["entries"], 2)
+        self.assertGreater(info["nbytes"], 0)
+        self.assertLessEqual(info["nbytes"], info["maxsize"])
+
+        # A cache miss for a different destination grid creates new
+        # weights and a new cache entry
+        with mock.patch.object(
+            regrid_module,
+            "create_esmpy_weights",
+            wraps=regrid_module.create_esmpy_weights,
+        ) as create_esmpy_weights:
+            src.regrids(dst[:, :-1], method="linear", return_operator=True)
+            create_esmpy_weights.assert_called_once()
+
+        self.assertEqual(weights_cache_info()["entries"], 3)
+
+        clear_weights_cache()
+        self.assertEqual(weights_cache_info()["entries"], 0)
+        self.assertEqual(weights_cache_info()["nbytes"], 0)
+
+    @unittest.skipUnless(esmpy_imported, "Requires esmpy/ESMF package.")
+    def test_Field_regrid_weights_cache_size(self):
+        """The regridding weights cache size can be changed"""
+        from cf.regrid import clear_weights_cache, weights_cache_info
+
+        dst = self.dst
+        src = self.src
+
+        clear_weights_cache()
+        try:
+            # A disabled cache doesn't create cache keys
+            regrid_module = sys.modules["cf.regrid.regrid"]
+            with cf.regrid_weights_cache_size(0):
+                with mock.patch.object(
+                    regrid_module,
+                    "weights_cache_key",
+                    wraps=regrid_module.weights_cache_key,
+                ) as weights_cache_key:
+                    src.regrids(dst, method="linear", return_operator=True)
+                    weights_cache_key.assert_not_called()
+
+                self.assertEqual(weights_cache_info()["entries"], 0)
+
+            src.regrids(dst, method="linear", return_operator=True)
+            info = weights_cache_info()
+            self.assertEqual(info["entries"], 1)
+            self.assertEqual(
+                info["maxsize"], cf.regrid_weights_cache_size().value
+            )
+
+            # Shrinking the cache discards weights that no longer fit
+            with cf.configuration(
+                regrid_weights_cache_size=info["nbytes"] - 1
+            ):
+                self.assertEqual(weights_cache_info()["entries"], 0)
+
+            with self.assertRaises(ValueError):
+                cf.regrid_weights_cache_size(-1)
+        finally:
+            clear_weights_cache()
+
+    @unittest.skipUnless(esmpy_imported, "Requires esmpy/ESMF package.")
+    def test_Field_regrid_esmpy_grids_destroyed(self):
+        """esmpy grids are destroyed when weights can't be created"""
+        regrid_module = sys.modules["cf.regrid.regrid"]
+        create_esmpy_grid = regrid_module.create_esmpy_grid
+        grid_destroy = esmpy.Grid.destroy
+
+        grids = []
+
+        def record_esmpy_grid(*args, **kwargs):
+            grid = create_esmpy_grid(*args, **kwargs)
+            grids.append(grid)
+            return grid
+
+        with cf.regrid_weights_cache_size(0), mock.patch.object(
+            regrid_module, "create_esmpy_grid", side_effect=record_esmpy_grid
+        ), mock.patch.object(
+            regrid_module, "create_esmpy_weights", side_effect=RuntimeError
+        ), mock.patch.object(
+            esmpy.Grid, "destroy", autospec=True, side_effect=grid_destroy
+        ) as destroy:
+            with self.assertRaises(RuntimeError):
+                self.src.regrids(self.dst, method="linear")
+
+        self.assertEqual(len(grids), 2)
+        destroyed = [call.args[0] for call in destroy.call_args_list]
+        for grid in grids:
+            self.assertTrue(any(g is grid for g in destroyed))
+
+    def test_dask_regrid_variable_mask(self):
+        """Regridding slices whose source masks vary"""
+        from scipy.sparse import random as sparse_random
+
+        from cf.data.dask_regrid import regrid
+
+        src_shape = (3, 4)
+        dst_shape = (2, 5)
+        weights = sparse_random(
+            10, 12, density=0.4, format="csr", random_state=0
+        )
+
+        # Four slices with masks A, B, A, C
+        rng = np.random.default_rng(0)
+        a = np.ma.array(rng.random((4,) + src_shape), mask=False)
+        a[[0, 2], 0, 1] = np.ma.masked
+        a[1, 1:, 2] = np.ma.masked
+        a[3, 2, :2] = np.ma.masked
+
+        kwargs = {
+            "src_shape": src_shape,
+            "dst_shape": dst_shape,
+            "axis_order": [0, 1, 2],
+        }
+        for method in ("linear", "conservative", "nearest_dtos"):
+            x = regrid(a, (weights, None), method=method, **kwargs)
+            self.assertEqual(x.shape, (4,) + dst_shape)
+            for t in range(a.shape[0]):
+                # Regrid the slice on its own
+                y = regrid(
+                    a[t : t + 1], (weights, None), method=method, **kwargs
+                )
+                mask = np.ma.getmaskarray(x[t])
+                self.assertTrue((mask == np.ma.getmaskarray(y[0])).all())
+                self.assertTrue(
+                    np.ma.allclose(x[t], y[0], atol=atol, rtol=rtol)
+                )
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())